@@ -45,12 +45,14 @@ def load_commands(subparsers):
 def get_uris(args: Namespace) -> Iterable[str]:
     if hasattr(args, 'uris_file') or hasattr(args, 'uris'):
         if hasattr(args, 'uris_file') and args.uris_file is not None:
-            yield from (line.rstrip() for line in args.uris_file)
+            # read the whole file in one call and split in C, instead of
+            # looping over it line by line in the interpreter
+            yield from args.uris_file.read().splitlines()
         if hasattr(args, 'uris') and args.uris is not None:
             yield from args.uris
     else:
         # fall back to STDIN
-        yield from (line.rstrip() for line in sys.stdin)
+        yield from sys.stdin.read().splitlines()
 
 
 def main():
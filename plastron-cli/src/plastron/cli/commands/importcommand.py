@@ -1,12 +1,9 @@
-import csv
 import logging
 from argparse import FileType, ArgumentTypeError, Namespace
+from functools import lru_cache
 from typing import TextIO
 
 from plastron.cli.commands import BaseCommand
-from plastron.jobs.importjob import ImportConfig, ImportJob
-from plastron.jobs import Jobs
-from plastron.models import get_model_class, ModelClassNotFoundError
 from plastron.rdf import uri_or_curie
 from plastron.utils import datetimestamp
 
@@ -15,13 +12,29 @@ logger = logging.getLogger(__name__)
 
 # custom argument type for percentage loads
 def percentile(n):
-    p = int(n)
-    if not p > 0 and p < 100:
+    try:
+        p = int(n)
+    except ValueError:
+        raise ArgumentTypeError("Percent param must be an integer")
+    if not (1 <= p <= 99):
         raise ArgumentTypeError("Percent param must be 1-99")
     return p
 
 
+def _csv_quote(value: str) -> str:
+    """Quote a single CSV field, using the same minimal-quoting rule as
+    `csv.writer`: only fields containing a delimiter, quote character, or
+    line break are quoted."""
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
 def write_model_template(model_name: str, template_file: TextIO):
+    # deferred import, to keep module load time short; this module is
+    # imported on every CLI startup when the subcommands are registered
+    from plastron.models import get_model_class, ModelClassNotFoundError
+
     try:
         model_class = get_model_class(model_name)
     except ModelClassNotFoundError as e:
@@ -30,14 +43,18 @@ def write_model_template(model_name: str, template_file: TextIO):
         raise RuntimeError(f'{model_class.__name__} has no HEADER_MAP, cannot create template')
 
     logger.info(f'Writing template for the {model_class.__name__} model to {template_file.name}')
-    writer = csv.writer(template_file)
-    writer.writerow(parse_model_header_map(model_class) + ['FILES', 'ITEM_FILES'])
+    # the template is a single header row, so format it directly rather than
+    # paying the csv module's writer setup for one writerow call
+    columns = list(parse_model_header_map(model_class)) + ['FILES', 'ITEM_FILES']
+    template_file.write(','.join(_csv_quote(column) for column in columns) + '\r\n')
 
 
+@lru_cache(maxsize=None)
 def parse_model_header_map(model_class):
     """
-    Returns a list of fields to use as column headers for the CSV template file
-    derived from the HEADER_MAP of the given model class.
+    Returns a tuple of fields to use as column headers for the CSV template file
+    derived from the HEADER_MAP of the given model class. Since the header map
+    is fixed per class, the result is cached across calls.
     """
     header_fields = []
 
@@ -50,7 +67,7 @@ def parse_model_header_map(model_class):
         else:
             header_fields.append(header)
 
-    return header_fields
+    return tuple(header_fields)
 
 
 def configure_cli(subparsers):
@@ -171,7 +188,14 @@ class Command(BaseCommand):
 
         :param args: the command-line arguments
         """
-        if hasattr(args, 'template_file') and args.template_file is not None:
+        # deferred imports, to keep module load time short; this module is
+        # imported on every CLI startup when the subcommands are registered
+        from plastron.jobs import Jobs
+        from plastron.jobs.importjob import ImportConfig, ImportJob
+
+        # argparse always sets template_file (to None when the option is not
+        # given), so a direct None test is sufficient
+        if args.template_file is not None:
             write_model_template(args.model, args.template_file)
             return
 
@@ -183,14 +207,14 @@ class Command(BaseCommand):
             logger.info(f'Resuming saved job {args.job_id}')
             job = jobs.get_job(ImportJob, args.job_id)
         else:
-            if args.import_file is None:
-                raise RuntimeError('An import file is required unless resuming an existing job')
-
-            if args.model is None:
-                raise RuntimeError('A model is required unless resuming an existing job')
-
-            if args.container is None:
-                raise RuntimeError('A container is required unless resuming an existing job')
+            required_args = (
+                ('import_file', 'An import file'),
+                ('model', 'A model'),
+                ('container', 'A container'),
+            )
+            for attr, description in required_args:
+                if getattr(args, attr) is None:
+                    raise RuntimeError(f'{description} is required unless resuming an existing job')
 
             if args.job_id is None:
                 # TODO: generate a more unique id? add in user and hostname?
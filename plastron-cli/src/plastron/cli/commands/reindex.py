@@ -3,11 +3,12 @@ from argparse import Namespace
 
 from plastron.cli import get_uris
 from plastron.cli.commands import BaseCommand
-from plastron.rdf import parse_predicate_list
-from plastron.rdfmapping.resources import RDFResource
 
 logger = logging.getLogger(__name__)
 
+# number of messages to buffer before sending them to the broker in one batch
+BATCH_SIZE = 128
+
 
 def configure_cli(subparsers):
     parser = subparsers.add_parser(
@@ -28,25 +29,42 @@ def configure_cli(subparsers):
 
 class Command(BaseCommand):
     def __call__(self, args: Namespace):
+        # deferred imports, to keep module load time short; this module is
+        # imported on every CLI startup when the subcommands are registered
+        from plastron.rdf import parse_predicate_list
+        from plastron.rdfmapping.resources import RDFResource
+
         self.context.broker.connect()
-        self.reindexing_queue = self.context.broker.destination('reindexing'),
+        self.reindexing_queue = self.context.broker.destination('reindexing')
         self.username = args.delegated_user or 'plastron'
         traverse = parse_predicate_list(args.recursive) if args.recursive is not None else []
         uris = get_uris(args)
 
+        # the parts of the message headers that are the same for every
+        # resource only need to be built once
+        base_headers = {
+            'CamelFcrepoUser': self.username,
+            'persistent': 'true'
+        }
+
+        headers_batch = []
         for uri in uris:
             for resource in self.context.repo[uri].walk(traverse=traverse):
                 logger.info(f'Reindexing {resource.url}')
                 types = ','.join(resource.describe(RDFResource).rdf_type.values)
-                self.context.broker.send(
-                    destination=self.reindexing_queue,
-                    headers={
-                        'CamelFcrepoUri': resource.url,
-                        'CamelFcrepoPath': resource.path,
-                        'CamelFcrepoResourceType': types,
-                        'CamelFcrepoUser': self.username,
-                        'persistent': 'true'
-                    }
-                )
+                headers_batch.append({
+                    # resource.url is a URLObject; stomp.py only accepts
+                    # exact str/bytes header values when encoding a frame
+                    'CamelFcrepoUri': str(resource.url),
+                    'CamelFcrepoPath': resource.path,
+                    'CamelFcrepoResourceType': types,
+                    **base_headers
+                })
+                if len(headers_batch) >= BATCH_SIZE:
+                    self.context.broker.send_many(self.reindexing_queue, headers_batch)
+                    headers_batch.clear()
+
+        if headers_batch:
+            self.context.broker.send_many(self.reindexing_queue, headers_batch)
 
         self.context.broker.disconnect()
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from http import HTTPStatus
 from mimetypes import guess_type
 from os.path import basename, isfile
-from typing import Mapping, Any, Protocol, Union, Set, List
+from typing import Callable, Mapping, Any, Protocol, Union, Set, List
 from urllib.parse import urlsplit
 
 from paramiko import SFTPClient, SSHClient, AutoAddPolicy, SSHException
@@ -189,7 +189,7 @@ class LocalFileSource(BinarySource):
 class HTTPFileSource(BinarySource):
     """A binary retrievable over HTTP at the given URI. Any additional keyword arguments
     are stored and added to all `requests.request()` calls."""
-    def __init__(self, uri, **kwargs):
+    def __init__(self, uri, session: Session = None, **kwargs):
         self.uri = uri
         """URI of the remote resource."""
         self.kwargs = kwargs
@@ -197,7 +197,9 @@ class HTTPFileSource(BinarySource):
         self.filename = basename(self.uri)
         """Filename-only portion of `uri`."""
         self._mimetype = None
-        self._client = Session()
+        # a shared session may be passed in, so that many sources from the
+        # same server can reuse one connection pool
+        self._client = session if session is not None else Session()
 
     def __str__(self):
         return str(self.uri)
@@ -247,14 +249,25 @@ class RepositoryFileSource(HTTPFileSource):
 
 class RemoteFileSource(BinarySource):
     """A binary retrievable over SFTP."""
-    def __init__(self, location: str, mimetype: str = None, ssh_options: Mapping[str, Any] = None):
+    def __init__(
+            self,
+            location: str,
+            mimetype: str = None,
+            ssh_options: Mapping[str, Any] = None,
+            ssh_client_factory: Callable[[], SSHClient] = None,
+    ):
         """
         :param location: the SFTP URI to the binary source, e.g., `sftp://user@example.com/path/to/file`
         :param mimetype: MIME type of the file. If not given, will attempt to detect by calling
             the `file` utility over an SSH connection.
         :param ssh_options: additional options to pass as keyword arguments to `SSHClient.connect()`
+        :param ssh_client_factory: zero-argument callable returning a connected `SSHClient`.
+            Use this to share one pooled connection across many sources: the factory's
+            caller retains ownership of the client, `close()` will not close it, and each
+            source sharing it only opens a new SFTP channel, not a new connection.
         """
         self._ssh_client = None
+        self._ssh_client_factory = ssh_client_factory
         self._sftp_client = None
         self.location = location
         self.sftp_uri = urlsplit(location)
@@ -277,12 +290,18 @@ class RemoteFileSource(BinarySource):
             self._sftp_client.close()
             self._sftp_client = None
         if self._ssh_client is not None:
-            self._ssh_client.close()
+            if self._ssh_client_factory is None:
+                # this source opened the connection, so it closes it; shared
+                # clients are closed by whoever created them
+                self._ssh_client.close()
             self._ssh_client = None
 
     def ssh(self) -> SSHClient:
         if self._ssh_client is None:
-            self._ssh_client = get_ssh_client(self.sftp_uri, **self.ssh_options)
+            if self._ssh_client_factory is not None:
+                self._ssh_client = self._ssh_client_factory()
+            else:
+                self._ssh_client = get_ssh_client(self.sftp_uri, **self.ssh_options)
         return self._ssh_client
 
     def sftp(self) -> SFTPClient:
@@ -323,7 +342,7 @@ class ZipFileSource(BinarySource):
     """
     A binary contained in a ZIP file.
     """
-    def __init__(self, zip_file, path, mimetype=None, ssh_options=None):
+    def __init__(self, zip_file, path, mimetype=None, ssh_options=None, ssh_client_factory=None):
         """
         :param zip_file: ZIP file. This may be a zipfile.ZipFile object,
             a string filename, an SFTP URI, or a readable file-like object.
@@ -332,6 +351,8 @@ class ZipFileSource(BinarySource):
             will attempt to guess based on the path given.
         :param ssh_options: additional options to pass as keyword arguments to SSHClient.connect
             (used when the zip_file is an SFTP URI)
+        :param ssh_client_factory: zero-argument callable returning a connected SSHClient,
+            used when the zip_file is an SFTP URI; see `RemoteFileSource`
         """
         self.ssh_options = ssh_options or {}
         self.zip_filename = None
@@ -354,7 +375,9 @@ class ZipFileSource(BinarySource):
             # from the zip file
             self.zip_file = None
             if isinstance(zip_file, str) and zip_file.startswith('sftp:'):
-                self.source = RemoteFileSource(zip_file, self._mimetype, self.ssh_options)
+                self.source = RemoteFileSource(
+                    zip_file, self._mimetype, self.ssh_options, ssh_client_factory=ssh_client_factory,
+                )
             else:
                 self.source = LocalFileSource(zip_file, self._mimetype, self.filename)
 
@@ -1,20 +1,45 @@
 import dataclasses
 import logging
+import os
 import re
 import urllib.parse
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, Dict, Any, Optional, List, Type, TypeVar
+from typing import Union, Dict, Any, Optional, List, Tuple, Type, TypeVar
 
 import yaml
 
+try:
+    # the libyaml-backed loader and dumper are substantially faster,
+    # but are only available if PyYAML was built with libyaml
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 from plastron.utils import ItemLog
 
 logger = logging.getLogger(__name__)
 
 
+_RUN_DIR_PATTERN = re.compile(r'^\d{14}$')
+
+
 def is_run_dir(path: Path) -> bool:
-    return path.is_dir() and re.match(r'^\d{14}$', path.name)
+    return path.is_dir() and _RUN_DIR_PATTERN.match(path.name)
+
+
+@lru_cache(maxsize=4096)
+def _safe_id(job_id: str) -> str:
+    """URL-quoted form of `job_id`, safe to use as a directory name. Cached,
+    since the STOMP daemon constructs a new job object for every message."""
+    return urllib.parse.quote(job_id, safe='')
+
+
+# parsed job configs, keyed by (config class, filename); each entry records
+# the file's mtime at parse time, so a changed file is re-read and replaces
+# the old entry instead of stranding it in the cache forever
+_config_cache: Dict[Tuple[type, str], Tuple[int, 'JobConfig']] = {}
 
 
 @dataclass
@@ -23,9 +48,18 @@ class JobConfig:
 
     @classmethod
     def from_file(cls, filename: Union[str, Path]):
+        try:
+            mtime = os.stat(filename).st_mtime_ns
+        except FileNotFoundError as e:
+            raise JobConfigError(f'Config file {filename} is missing') from e
+        cache_key = (cls, str(filename))
+        cached = _config_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            # return a copy, so callers can modify their config freely
+            return dataclasses.replace(cached[1])
         try:
             with open(filename) as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=SafeLoader)
         except FileNotFoundError as e:
             raise JobConfigError(f'Config file {filename} is missing') from e
         if config is None:
@@ -34,12 +68,18 @@ class JobConfig:
             # catch any improperly serialized "None" values, and convert to None
             if value == 'None':
                 config[key] = None
-        return cls(**config)
+        instance = cls(**config)
+        _config_cache[cache_key] = (mtime, dataclasses.replace(instance))
+        return instance
 
     def save(self, filename: Union[str, Path]):
         config = {k: str(v) if v is not None else v for k, v in vars(self).items()}
-        with open(filename, mode='w') as file:
-            yaml.dump(data=config, stream=file)
+        # write to a temporary file and atomically swap it into place, so an
+        # interrupted save never leaves behind a truncated config file
+        tmp_filename = str(filename) + '.tmp'
+        with open(tmp_filename, mode='w') as file:
+            yaml.dump(data=config, stream=file, Dumper=SafeDumper)
+        os.replace(tmp_filename, filename)
 
 
 class Job:
@@ -70,8 +110,14 @@ class Job:
         return self
 
     def update_config(self, job_config_args: Dict[str, Any]):
-        """Update the config with values from `job_config_args` that are not `None`."""
-        self.config = dataclasses.replace(self.config, **{k: v for k, v in job_config_args.items() if v is not None})
+        """Update the config with values from `job_config_args` that are not `None`.
+
+        The config object is updated in place; this is safe, since
+        `JobConfig.from_file` always hands out a private copy. In the common
+        resume case where nothing has changed, no work is done at all."""
+        for key, value in job_config_args.items():
+            if value is not None and value != getattr(self.config, key):
+                setattr(self.config, key, value)
         return self
 
     def new_run(self):
@@ -86,7 +132,13 @@ class Job:
 
     @property
     def runs(self) -> List[str]:
-        return sorted((d.name for d in filter(is_run_dir, self.dir.iterdir())), reverse=True)
+        # os.scandir can usually answer is_dir() from the directory entry
+        # itself, avoiding a stat call per entry
+        with os.scandir(self.dir) as entries:
+            return sorted(
+                (entry.name for entry in entries if _RUN_DIR_PATTERN.match(entry.name) and entry.is_dir()),
+                reverse=True,
+            )
 
     def latest_run(self):
         try:
@@ -113,8 +165,7 @@ class Jobs:
                 f'differs from the expected config class for "{job_class.__name__}": '
                 f'"{job_class.config_class.__name__}"'
             )
-        safe_id = urllib.parse.quote(config.job_id, safe='')
-        job_dir = self.dir / safe_id
+        job_dir = self.dir / _safe_id(config.job_id)
         if job_dir.exists():
             raise RuntimeError(f'Job directory {job_dir} for job id {config.job_id} already exists')
         job_dir.mkdir(parents=True, exist_ok=True)
@@ -122,8 +173,7 @@ class Jobs:
         return job_class(job_id=config.job_id, job_dir=job_dir).load_config()
 
     def get_job(self, job_class: Type[J], job_id: str) -> J:
-        safe_id = urllib.parse.quote(job_id, safe='')
-        job_dir = self.dir / safe_id
+        job_dir = self.dir / _safe_id(job_id)
         if not job_dir.exists():
             raise JobNotFoundError(f'Job directory {job_dir} for job id {job_id} does not exist')
         return job_class(job_id=job_id, job_dir=job_dir).load_config()
@@ -1,20 +1,36 @@
+import hashlib
 import logging
 import os
-from collections import Counter
+import shlex
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
+from functools import partial
 from os.path import basename
 from pathlib import Path
 from shutil import copyfileobj
-from typing import Optional, Any, IO, List, Generator, Dict, Iterable
+from typing import Optional, Any, Callable, IO, List, Generator, Dict, FrozenSet, Iterable, Tuple
+from urllib.parse import urlsplit
 
 from bs4 import BeautifulSoup
+from paramiko import SSHClient
 from rdflib import URIRef
+from requests import Session
 
 from plastron.client import ClientError
 from plastron.context import PlastronContext
-from plastron.files import BinarySource, ZipFileSource, RemoteFileSource, HTTPFileSource, LocalFileSource
+from plastron.files import (
+    BinarySource,
+    BinarySourceError,
+    ZipFileSource,
+    RemoteFileSource,
+    HTTPFileSource,
+    LocalFileSource,
+    get_ssh_client,
+)
 from plastron.handles import HandleInfo
 from plastron.jobs import JobError, JobConfig, Job
 from plastron.jobs.importjob.spreadsheet import LineReference, MetadataSpreadsheet, InvalidRow, Row, MetadataError
@@ -23,16 +39,20 @@ from plastron.models.annotations import FullTextAnnotation, TextualBody
 from plastron.namespaces import umdaccess, sc
 from plastron.rdf.pcdm import File, PreservationMasterFile
 from plastron.rdfmapping.validation import ValidationResultsDict, ValidationResult, ValidationSuccess, ValidationFailure
-from plastron.repo import RepositoryError, ContainerResource
+from plastron.repo import Repository, RepositoryError, ContainerResource
 from plastron.repo.pcdm import PCDMObjectResource
 from plastron.repo.publish import PublishableResource
-from plastron.utils import datetimestamp, ItemLog
+from plastron.utils import datetimestamp, AsyncItemLog, ItemLog
 from plastron.validation import ValidationError
 
 logger = logging.getLogger(__name__)
 DROPPED_INVALID_FIELDNAMES = ['id', 'timestamp', 'title', 'uri', 'reason']
 DROPPED_FAILED_FIELDNAMES = ['id', 'timestamp', 'title', 'uri', 'reason']
 
+# number of worker threads used to prepare and validate upcoming rows
+# while earlier rows are being loaded into the repository
+VALIDATION_WORKERS = 4
+
 
 class ImportedItemStatus(Enum):
     CREATED = 'created'
@@ -133,12 +153,51 @@ class ImportRun:
         print('job status', result['type'])
         ```
         """
+        try:
+            return (yield from self._run(
+                context=context,
+                limit=limit,
+                percentage=percentage,
+                validate_only=validate_only,
+                import_file=import_file,
+                publish=publish,
+            ))
+        finally:
+            try:
+                # even when the run exits early with an error, write any
+                # queued completed-log rows and stop the writer thread, so
+                # the log accounts for every item that was actually loaded
+                # and a long-lived daemon does not leak a thread and an open
+                # file handle for every import message it processes
+                self.job.completed_log.close()
+            finally:
+                try:
+                    # the validated log buffers its rows; close it so the
+                    # digests reach the disk for the next run to reuse
+                    self.job.validated_log.close()
+                finally:
+                    # close any pooled SSH/HTTP connections opened during the run
+                    self.job.close_connections()
+
+    def _run(
+            self,
+            context: PlastronContext,
+            limit: int = None,
+            percentage: int = None,
+            validate_only: bool = False,
+            import_file: IO = None,
+            publish: bool = False,
+    ) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
         if self.dir is not None:
             raise RuntimeError('Run completed, cannot start again')
         self.timestamp = datetimestamp()
         self.dir = self.job.dir / self.timestamp
         self.dir.mkdir(parents=True, exist_ok=True)
-        start_time = datetime.now().timestamp()
+        # wall-clock start for display; elapsed time is measured with the
+        # monotonic clock, which is much cheaper to read than datetime.now()
+        # and is immune to system clock adjustments mid-run
+        start_time = time.time()
+        start_mono = time.monotonic()
 
         if percentage:
             logger.info(f'Loading {percentage}% of the total items')
@@ -158,43 +217,62 @@ class ImportRun:
         except JobError as e:
             raise RuntimeError(str(e)) from e
 
-        count = Counter(
-            total_items=metadata.total,
-            rows=0,
-            errors=0,
-            initially_completed_items=len(self.job.completed_log),
-            files=0,
-            valid_items=0,
-            invalid_items=0,
-            created_items=0,
-            updated_items=0,
-            unchanged_items=0,
-            skipped_items=0,
-        )
+        count = {
+            'total_items': metadata.total,
+            'rows': 0,
+            'errors': 0,
+            'initially_completed_items': len(self.job.completed_log),
+            'files': 0,
+            'valid_items': 0,
+            'invalid_items': 0,
+            'created_items': 0,
+            'updated_items': 0,
+            'unchanged_items': 0,
+            'skipped_items': 0,
+            'items_with_errors': 0,
+        }
         logger.info(f'Found {count["initially_completed_items"]} completed items')
         if count['initially_completed_items'] > 0:
             logger.debug(f'Completed item identifiers: {self.job.completed_log._item_keys}')
 
-        for row in metadata.rows(limit=limit, percentage=percentage, completed=self.job.completed_log):
+        # track the per-row counters in locals while looping, instead of
+        # paying a dict hash lookup for each increment; they are copied back
+        # into count in one update() call before each yield and at the end
+        files = valid_items = invalid_items = 0
+        created_items = updated_items = unchanged_items = skipped_items = items_with_errors = 0
+
+        def sync_count():
+            count.update(
+                files=files,
+                valid_items=valid_items,
+                invalid_items=invalid_items,
+                created_items=created_items,
+                updated_items=updated_items,
+                unchanged_items=unchanged_items,
+                skipped_items=skipped_items,
+                items_with_errors=items_with_errors,
+            )
+
+        rows = metadata.rows(limit=limit, percentage=percentage, completed=self.job.completed_log)
+        for row, import_row, validation in self._prepare_rows(rows, context, validate_only, publish):
             if isinstance(row, InvalidRow):
                 self.drop_invalid(item=None, line_reference=row.line_reference, reason=row.reason)
-                count['invalid_items'] += 1
+                invalid_items += 1
                 continue
 
-            logger.debug(f'Row data: {row.data}')
-            import_row = ImportRow(self.job, context, row, validate_only, publish)
-
             # count the number of files referenced in this row
-            count['files'] += len(row.filenames)
+            files += len(row.filenames)
 
-            # validate metadata and files
-            validation = import_row.validate_item()
             if validation.ok:
-                count['valid_items'] += 1
+                valid_items += 1
                 logger.info(f'"{import_row}" is valid')
+                # remember this item state as validated, so that a resumed
+                # run can skip revalidating it
+                if import_row.digest not in self.job.validated_log:
+                    self.job.validated_log.append({'digest': import_row.digest})
             else:
                 # drop invalid items
-                count['invalid_items'] += 1
+                invalid_items += 1
                 logger.warning(f'"{import_row}" is invalid, skipping')
                 reasons = [f'{name} {result}' for name, result in validation.failures()]
                 self.drop_invalid(
@@ -208,34 +286,48 @@ class ImportRun:
                 # validation-only mode
                 continue
 
+            if import_row.identifier in self.job.completed_log:
+                # rows are prepared ahead of the repository updates, so a row
+                # whose identifier duplicates an earlier, not-yet-loaded row
+                # passes the completed check in metadata.rows(); recheck here,
+                # once all the earlier rows have actually completed
+                logger.info(f'Already loaded "{import_row.identifier}" from {row.line_reference}, skipping')
+                continue
+
             try:
                 status = import_row.update_repo()
                 self.complete(import_row, status)
                 if status == ImportedItemStatus.CREATED:
-                    count['created_items'] += 1
+                    created_items += 1
                 elif status == ImportedItemStatus.MODIFIED:
-                    count['updated_items'] += 1
+                    updated_items += 1
                 elif status == ImportedItemStatus.UNCHANGED:
-                    count['unchanged_items'] += 1
-                    count['skipped_items'] += 1
+                    unchanged_items += 1
+                    skipped_items += 1
                 else:
                     raise RuntimeError(f'Unknown status "{status}" returned when importing "{import_row.item}"')
             except JobError as e:
-                count['items_with_errors'] += 1
+                items_with_errors += 1
                 logger.error(f'{import_row} import failed: {e}')
                 self.drop_failed(import_row.item, row.line_reference, reason=str(e))
 
             # update the status
-            now = datetime.now().timestamp()
+            sync_count()
+            elapsed = time.monotonic() - start_mono
             yield {
                 'time': {
                     'started': start_time,
-                    'now': now,
-                    'elapsed': now - start_time
+                    'now': start_time + elapsed,
+                    'elapsed': elapsed
                 },
                 'count': count,
             }
 
+        # wait for any queued completed-log rows to reach the disk before
+        # reporting the final status
+        self.job.completed_log.join()
+
+        sync_count()
         if validate_only:
             # validate phase
             if count['invalid_items'] == 0:
@@ -255,6 +347,50 @@ class ImportRun:
             'count': count,
         }
 
+    def _prepare_rows(self, rows, context: PlastronContext, validate_only: bool, publish: bool):
+        """Yield `(row, import_row, validation)` tuples in row order. Row
+        preparation and validation (which may read from the repository and
+        probe binary sources) runs on a bounded pool of worker threads, so
+        that upcoming rows are validated while earlier rows are still being
+        loaded into the repository. Repository updates and log writes remain
+        serialized in the caller. `InvalidRow` entries are yielded as
+        `(row, None, None)`."""
+
+        # the caller opens transactions on context.repo while loading earlier
+        # rows, and Repository.client routes every request through an open
+        # transaction; give the workers their own repository over the same
+        # underlying client, so their reads are never rewritten into
+        # transaction URI space or caught mid-request by a commit
+        reader_repo = context.repo.outside_transaction()
+
+        def prepare(row: Row):
+            # lazy formatting, so the row data is only stringified when
+            # DEBUG logging is actually enabled
+            logger.debug('Row data: %s', row.data)
+            import_row = ImportRow(self.job, context, row, validate_only, publish, repo=reader_repo)
+            return row, import_row, import_row.validate_item()
+
+        with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as executor:
+            # bound the number of rows in flight so validation does not run
+            # arbitrarily far ahead of the repository updates
+            max_pending = VALIDATION_WORKERS * 2
+            pending = deque()
+            for row in rows:
+                if isinstance(row, InvalidRow):
+                    pending.append((row, None, None))
+                else:
+                    pending.append(executor.submit(prepare, row))
+                while len(pending) >= max_pending:
+                    yield self._resolve_prepared(pending.popleft())
+            while pending:
+                yield self._resolve_prepared(pending.popleft())
+
+    @staticmethod
+    def _resolve_prepared(entry):
+        if isinstance(entry, tuple):
+            return entry
+        return entry.result()
+
     def drop_failed(self, item, line_reference, reason=''):
         """
         Add the item to the log of failed items for this run.
@@ -310,8 +446,31 @@ class ImportJob(Job):
         super().__init__(job_id=job_id, job_dir=job_dir)
 
         self._model_class = None
+        # move completed-log writes off the row-processing loop; the run
+        # joins the queue before reporting its final status
+        self.completed_log = AsyncItemLog(self.completed_log)
         self.ssh_private_key = ssh_private_key
         self.validation_reports = []
+        # digests of item graphs that have already passed metadata
+        # validation; lets resumed runs skip revalidating unchanged items.
+        # rows are buffered rather than flushed one by one — losing a few
+        # digests in a crash only costs revalidation on the next run — and
+        # the run's cleanup closes (and so flushes) the log
+        self.validated_log = ItemLog(self.dir / 'validated.log.csv', ['digest'], 'digest', flush_interval=100)
+        self._listing_cache: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._source_cache: Dict[Tuple[str, str], BinarySource] = {}
+        self._source_factories: Dict[str, Callable[[str], BinarySource]] = {}
+        # shared connections, keyed by (username, hostname, port) for SSH;
+        # opened lazily and closed by close_connections() at the end of a run
+        self._ssh_clients: Dict[Tuple[Optional[str], Optional[str], Optional[int]], SSHClient] = {}
+        self._http_session: Optional[Session] = None
+        # row validation runs on several worker threads, so the caches above
+        # must not be filled twice for the same key; each lock guards its own
+        # cache (the listing lock is separate because building a listing may
+        # itself need a shared SSH client)
+        self._connection_lock = threading.Lock()
+        self._listing_lock = threading.Lock()
+        self._source_lock = threading.Lock()
 
     @property
     def metadata_filename(self) -> Path:
@@ -325,7 +484,9 @@ class ImportJob(Job):
 
     def store_metadata_file(self, input_file: IO):
         with open(self.metadata_filename, mode='w') as file:
-            copyfileobj(input_file, file)
+            # use a 1 MiB buffer instead of copyfileobj's 16 KiB default, to
+            # cut the number of read/write calls on large metadata files
+            copyfileobj(input_file, file, length=1 << 20)
             logger.debug(f"Copied input file {getattr(input_file, 'name', '<>')} to {file.name}")
 
     def complete(self, row, status: ImportedItemStatus):
@@ -395,29 +556,192 @@ class ImportJob(Job):
         * ``zip+sftp:<user>@<host>/<path to zipfile>``
         * ``<local dir path>``
 
+        Sources are cached by ``(base_location, path)``, so repeated requests
+        for the same file (e.g., during validation and again when creating
+        resources) share one `BinarySource` instance.
+
         :param base_location:
         :param path:
         :return:
         """
+        key = (base_location, path)
+        with self._source_lock:
+            source = self._source_cache.get(key)
+            if source is None:
+                factory = self._source_factories.get(base_location)
+                if factory is None:
+                    factory = self._source_factories[base_location] = self._build_source_factory(base_location)
+                source = self._source_cache[key] = factory(path)
+            return source
+
+    @property
+    def http_session(self) -> Session:
+        """Shared HTTP session, so that sources served from the same host
+        reuse one connection pool instead of opening a new TCP (and possibly
+        TLS) connection per file."""
+        with self._connection_lock:
+            if self._http_session is None:
+                self._http_session = Session()
+            return self._http_session
+
+    def get_shared_ssh_client(self, sftp_uri) -> SSHClient:
+        """Get a shared, connected `SSHClient` for the given SFTP URI (a
+        string or a `SplitResult`). Connections are pooled per
+        (username, hostname, port), so the expensive SSH key exchange
+        happens once per remote host instead of once per file. The job owns
+        the pooled clients; call `close_connections()` to close them."""
+        if isinstance(sftp_uri, str):
+            sftp_uri = urlsplit(sftp_uri)
+        key = (sftp_uri.username, sftp_uri.hostname, sftp_uri.port)
+        # without the lock, two worker threads could both open a connection
+        # to the same host, and the one that loses the race would never be
+        # closed by close_connections()
+        with self._connection_lock:
+            client = self._ssh_clients.get(key)
+            if client is None:
+                client = self._ssh_clients[key] = get_ssh_client(sftp_uri, key_filename=self.ssh_private_key)
+            return client
+
+    def close_connections(self):
+        """Close the pooled SSH clients and the shared HTTP session, and
+        discard any cached sources that reference them."""
+        with self._connection_lock:
+            for client in self._ssh_clients.values():
+                client.close()
+            self._ssh_clients.clear()
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
+        with self._source_lock:
+            self._source_cache.clear()
+
+    def _build_source_factory(self, base_location: str) -> Callable[[str], BinarySource]:
+        """Resolve the scheme of ``base_location`` once, and return a factory
+        that builds a `BinarySource` for a path under that location. The
+        factory is cached per location by `get_source`, so the scheme prefix
+        checks are not repeated for every file."""
         if base_location.startswith('zip:'):
-            return ZipFileSource(base_location[4:], path)
+            zip_file = base_location[4:]
+
+            def factory(path: str) -> BinarySource:
+                return ZipFileSource(zip_file, path)
+
         elif base_location.startswith('sftp:'):
-            return RemoteFileSource(
-                location=os.path.join(base_location, path),
-                ssh_options={'key_filename': self.ssh_private_key}
-            )
+            ssh_options = {'key_filename': self.ssh_private_key}
+            base_uri = urlsplit(base_location)
+
+            def factory(path: str) -> BinarySource:
+                return RemoteFileSource(
+                    location=os.path.join(base_location, path),
+                    ssh_options=ssh_options,
+                    ssh_client_factory=partial(self.get_shared_ssh_client, base_uri),
+                )
+
         elif base_location.startswith('http:') or base_location.startswith('https:'):
             base_uri = base_location if base_location.endswith('/') else base_location + '/'
-            return HTTPFileSource(base_uri + path)
+
+            def factory(path: str) -> BinarySource:
+                return HTTPFileSource(f'{base_uri}{path}', session=self.http_session)
+
         elif base_location.startswith('zip+sftp:'):
-            return ZipFileSource(
-                zip_file=base_location[4:],
-                path=path,
-                ssh_options={'key_filename': self.ssh_private_key}
-            )
+            zip_file = base_location[4:]
+            ssh_options = {'key_filename': self.ssh_private_key}
+
+            def factory(path: str) -> BinarySource:
+                return ZipFileSource(
+                    zip_file=zip_file,
+                    path=path,
+                    ssh_options=ssh_options,
+                    ssh_client_factory=partial(self.get_shared_ssh_client, zip_file),
+                )
+
         else:
             # with no URI prefix, assume a local file path
-            return LocalFileSource(localpath=os.path.join(base_location, path))
+            def factory(path: str) -> BinarySource:
+                return LocalFileSource(localpath=os.path.join(base_location, path))
+
+        return factory
+
+    def file_listing(self, base_location: str) -> Optional[FrozenSet[str]]:
+        """
+        Get the set of file paths available under ``base_location``, relative
+        to that location, or ``None`` if the location cannot be enumerated in
+        bulk. Listings are computed once per job instance and cached, so
+        checking many files for existence costs one enumeration per location
+        instead of one probe per file.
+
+        Zip archives (local or SFTP) are listed from the archive directory,
+        SFTP directories with a single remote ``find`` command, and local
+        directories with one ``os.walk`` (which uses ``os.scandir`` under
+        the hood, avoiding a ``stat`` call per file). Plain HTTP locations
+        return ``None``; callers should fall back to per-file existence
+        checks for those.
+
+        :param base_location:
+        :return:
+        """
+        # holding the lock while the listing is built keeps concurrent
+        # workers from all running the same expensive enumeration
+        with self._listing_lock:
+            if base_location not in self._listing_cache:
+                self._listing_cache[base_location] = self._build_listing(base_location)
+            return self._listing_cache[base_location]
+
+    def _build_listing(self, base_location: str) -> Optional[FrozenSet[str]]:
+        if base_location is None:
+            return None
+        if base_location.startswith('zip:') or base_location.startswith('zip+sftp:'):
+            zip_location = base_location[4:]
+            source = ZipFileSource(
+                zip_file=zip_location,
+                path='',
+                ssh_options={'key_filename': self.ssh_private_key},
+                ssh_client_factory=(
+                    partial(self.get_shared_ssh_client, zip_location) if zip_location.startswith('sftp:') else None
+                ),
+            )
+            try:
+                return frozenset(source.get_zip_file().namelist())
+            except BinarySourceError as e:
+                # a missing or unreadable archive must not abort the whole
+                # run; fall back to the per-file checks, which report the
+                # problem row by row
+                logger.warning(f'Unable to list {zip_location}: {e}')
+                return None
+            finally:
+                source.close()
+        elif base_location.startswith('sftp:'):
+            sftp_uri = urlsplit(base_location)
+            ssh_client = self.get_shared_ssh_client(sftp_uri)
+            # -L follows symlinks, matching the per-file stat-based checks
+            _, stdout, stderr = ssh_client.exec_command(f'find -L {shlex.quote(sftp_uri.path)} -type f')
+            # read all the output before checking the exit status, so the
+            # remote command cannot block on a full output buffer
+            lines = stdout.read().decode().splitlines()
+            if stdout.channel.recv_exit_status() != 0:
+                # without a listing, fall back to the per-file existence
+                # checks rather than treating every file as missing
+                logger.warning(f'Unable to list {base_location}: {stderr.read().decode().strip()}')
+                return None
+            prefix = sftp_uri.path.rstrip('/') + '/'
+            return frozenset(
+                line[len(prefix):] if line.startswith(prefix) else line
+                for line in lines
+            )
+        elif base_location.startswith('http:') or base_location.startswith('https:'):
+            # no bulk listing for plain HTTP locations
+            return None
+        elif os.path.isdir(base_location):
+            names = set()
+            # follow symlinks, matching the per-file isfile() checks
+            for dirpath, _, filenames in os.walk(base_location, followlinks=True):
+                reldir = os.path.relpath(dirpath, base_location)
+                for name in filenames:
+                    names.add(name if reldir == os.curdir else os.path.join(reldir, name))
+            return frozenset(names)
+        else:
+            # not a directory; leave the per-file checks to report the errors
+            return None
 
     def get_file(self, base_location: str, filename: str) -> File:
         """
@@ -455,11 +779,16 @@ class ImportRow:
             row: Row,
             validate_only: bool = False,
             publish: bool = None,
+            repo: Repository = None,
     ):
         self.job = job
         self.row = row
         self.context = context
-        self.item = row.get_object(context.repo, read_from_repo=not validate_only)
+        # the initial read of the item may happen on a worker thread; the
+        # caller can pass a dedicated repository for it, so that read does
+        # not go through a transaction open on the context's repository
+        self.item = row.get_object(repo if repo is not None else context.repo, read_from_repo=not validate_only)
+        self._digest = None
         if publish is not None:
             self._publish = publish
 
@@ -470,13 +799,29 @@ class ImportRow:
     def identifier(self):
         return self.row.identifier
 
+    @property
+    def digest(self) -> str:
+        """Content hash of this row's item graph. Two rows describing the
+        same item state hash to the same digest, so validation results can
+        be memoized across runs."""
+        if self._digest is None:
+            triples = sorted(self.item.graph.serialize(format='nt').splitlines())
+            self._digest = hashlib.blake2b('\n'.join(triples).encode(), digest_size=16).hexdigest()
+        return self._digest
+
     def validate_item(self) -> ValidationResultsDict:
         """Validate the item for this import row, and check that all files
-        listed are present."""
-        try:
-            results: ValidationResultsDict = self.item.validate()
-        except ValidationError as e:
-            raise RuntimeError(f'Unable to run validation: {e}') from e
+        listed are present. Items whose graph digest is recorded as having
+        passed validation in an earlier run skip the metadata validation;
+        the file existence checks always run."""
+        if self.digest in self.job.validated_log:
+            logger.debug('Item for %s previously validated; skipping metadata validation', self.row.line_reference)
+            results = ValidationResultsDict()
+        else:
+            try:
+                results = self.item.validate()
+            except ValidationError as e:
+                raise RuntimeError(f'Unable to run validation: {e}') from e
 
         # binaries_location is only required if there is a value in the
         # "FILES" or "ITEM_FILES" column.
@@ -493,10 +838,31 @@ class ImportRow:
     def validate_files(self, filenames: Iterable[str]) -> ValidationResult:
         """Check that a file exists in the job's binaries location for each
         file name given."""
-        missing_files = [
-            name for name in filenames
-            if not self.job.get_source(self.job.config.binaries_location, name).exists()
-        ]
+        # rows may list the same file more than once (e.g. shared derivative
+        # sources), so only check each unique name
+        names = set(filenames)
+        if not names:
+            return ValidationSuccess(
+                prop=None,
+                message='All files present',
+            )
+        base_location = self.job.config.binaries_location
+        listing = self.job.file_listing(base_location)
+        if listing is not None:
+            # answer the existence checks from the cached bulk listing, but
+            # re-probe any misses individually before reporting them: the
+            # listing may be stricter than the per-file checks (or trip on
+            # edge cases like filenames containing newlines), and a false
+            # "missing" report silently drops a valid row
+            missing_files = [
+                name for name in names
+                if name not in listing and not self.job.get_source(base_location, name).exists()
+            ]
+        else:
+            missing_files = [
+                name for name in names
+                if not self.job.get_source(base_location, name).exists()
+            ]
         if len(missing_files) == 0:
             return ValidationSuccess(
                 prop=None,
@@ -520,7 +886,10 @@ class ImportRow:
             # construct the SPARQL Update query if there are any deletions or insertions
             # then do a PATCH update of an existing item
             try:
-                resource: PublishableObjectResource = self.context.repo[self.item.uri:PublishableObjectResource].read()
+                # the item's graph was already read from the repository when
+                # this row was constructed, so attach it to a new resource
+                # handle rather than fetching the description a second time
+                resource: PublishableObjectResource = self.context.repo[self.item.uri:PublishableObjectResource]
                 resource.attach_description(self.item)
                 resource.update()
                 # publish this resource, if requested
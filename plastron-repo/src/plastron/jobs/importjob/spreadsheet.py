@@ -249,6 +249,7 @@ class Row:
         self.identifier_column = identifier_column
         self._file_groups = build_file_groups(self.data.get('FILES', ''))
         self._filenames = list(chain(*[group.filenames for group in self._file_groups.values()]))
+        self._item_filenames = self.data['ITEM_FILES'].strip().split(';') if self.has_item_files else []
 
     def __getitem__(self, item):
         return self.data[item]
@@ -318,7 +319,7 @@ class Row:
 
     @property
     def item_filenames(self):
-        return self.data['ITEM_FILES'].strip().split(';') if self.has_item_files else []
+        return self._item_filenames
 
     @property
     def index_string(self):
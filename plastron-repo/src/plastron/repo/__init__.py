@@ -69,6 +69,13 @@ class Repository:
     def client(self):
         return self._txn_client or self._client
 
+    def outside_transaction(self) -> 'Repository':
+        """Return a new `Repository` over the same underlying client. Requests
+        made through the new instance are never routed through a transaction
+        opened on this instance, so it is safe to use from other threads while
+        a transaction is in progress here."""
+        return Repository(client=self._client)
+
     def get_resource(self, path: str, resource_class: Type[ResourceType] = None) -> ResourceType:
         """Get an object representing a resource at a particular path with this repository.
 
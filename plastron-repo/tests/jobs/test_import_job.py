@@ -219,3 +219,88 @@ def test_import_job_validation_passes_for_job_with_files_column_and_no_files_spe
 
     return_value = exc_info.value.value
     assert return_value['type'] == 'validate_success'
+
+
+def test_import_job_prepares_rows_outside_transaction(import_file, jobs):
+    mock_container = MockContainer()
+    mock_repo = MagicMock(spec=Repository)
+    mock_repo.transaction.return_value = nullcontext()
+    mock_repo.__getitem__.return_value = mock_container
+    mock_context = MagicMock(spec=PlastronContext, repo=mock_repo)
+
+    import_job = jobs.create_job(ImportJob, config=ImportConfig(job_id='123', model='Item'))
+    statuses = import_job.run(context=mock_context, import_file=import_file.open())
+    with pytest.raises(StopIteration) as exc_info:
+        while True:
+            next(statuses)
+
+    # the workers read items through a repository that cannot be routed
+    # through a transaction opened on the context's repository
+    mock_repo.outside_transaction.assert_called_once()
+    # despite being prepared concurrently, every row is loaded, in CSV order
+    assert exc_info.value.value['count']['created_items'] == 9
+    assert [row['id'] for row in import_job.completed_log] == [
+        'test-unmarked',
+        'test-publish',
+        'test-hidden',
+        'test-publish-hidden',
+        'test-not-publish',
+        'test-not-hidden',
+        'test-not-publish-not-hidden',
+        'test-not-publish-hidden',
+        'test-publish-not-hidden',
+    ]
+
+
+def test_import_job_skips_duplicate_identifier(jobs, datadir):
+    # two rows in the CSV share an identifier; rows are prepared ahead of the
+    # repository updates, so the second row is only caught by the completed
+    # recheck in the main loop, after the first row has finished loading
+    import_file = datadir / 'duplicate_identifier.csv'
+    mock_container = MockContainer()
+    mock_repo = MagicMock(spec=Repository)
+    mock_repo.transaction.return_value = nullcontext()
+    mock_repo.__getitem__.return_value = mock_container
+    mock_context = MagicMock(spec=PlastronContext, repo=mock_repo)
+
+    import_job = jobs.create_job(ImportJob, config=ImportConfig(job_id='789', model='Item'))
+    statuses = import_job.run(context=mock_context, import_file=import_file.open())
+    with pytest.raises(StopIteration) as exc_info:
+        while True:
+            next(statuses)
+
+    assert exc_info.value.value['count']['created_items'] == 1
+    assert len(import_job.completed_log) == 1
+
+
+def test_file_listing_missing_zip_falls_back(jobs):
+    job = jobs.create_job(ImportJob, config=ImportConfig(job_id='zip-test', model='Item'))
+    # a missing archive must not raise out of the listing; returning None
+    # makes the callers fall back to per-file existence checks
+    assert job.file_listing('zip:/no/such/file.zip') is None
+
+
+def test_import_job_validation_reprobes_listing_misses(jobs, datadir, tmpdir):
+    """
+    Verifies that a file absent from the bulk listing (which may be stricter
+    than the per-file checks, e.g. for symlinked trees) is re-probed
+    individually before it is reported missing
+    """
+    import_file = datadir / 'item_with_file_in_item_files_column.csv'
+    binaries_location = tmpdir.mkdir('test_binary_location')
+    temp_binary_file = binaries_location / 'test_file.tif'
+    temp_binary_file.write('Test file')
+
+    mock_repo = MagicMock(spec=Repository)
+    mock_context = MagicMock(spec=PlastronContext, repo=mock_repo)
+
+    import_job = jobs.create_job(
+        ImportJob,
+        config=ImportConfig(job_id='457', model='Item', binaries_location=str(binaries_location))
+    )
+    import_job._listing_cache[str(binaries_location)] = frozenset()
+    with pytest.raises(StopIteration) as exc_info:
+        next(import_job.run(context=mock_context, validate_only=True, import_file=import_file.open()))
+
+    return_value = exc_info.value.value
+    assert return_value['type'] == 'validate_success'
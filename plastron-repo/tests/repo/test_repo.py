@@ -1,5 +1,8 @@
+from unittest.mock import MagicMock
+
 import pytest
 
+from plastron.client import Client
 from plastron.repo import Repository, RepositoryResource, ContainerResource
 
 
@@ -39,3 +42,17 @@ def test_get_item(repository, input_value, expected_path, expected_class):
     resource = repository[input_value]
     assert resource.path == expected_path
     assert isinstance(resource, expected_class)
+
+
+def test_outside_transaction():
+    client = MagicMock(spec=Client, endpoint=MagicMock())
+    repo = Repository(client=client)
+    reader = repo.outside_transaction()
+
+    with repo.transaction():
+        # the original repository routes requests through the transaction
+        # client, but the new repository still uses the plain client
+        assert repo.client is not client
+        assert reader.client is client
+
+    assert repo.client is client
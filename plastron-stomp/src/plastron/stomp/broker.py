@@ -86,6 +86,17 @@ class Broker:
             **kwargs
         )
 
+    def send_many(self, destination, headers_list, body='', **kwargs):
+        """Send a batch of frames to the same destination back-to-back,
+        without waiting on a receipt between frames. ``destination`` may be
+        a `Destination` object or a destination name."""
+        # stomp.py only accepts exact str/bytes values when encoding a
+        # frame, so resolve a Destination object to its name up front
+        destination = str(destination)
+        send = self.connection.send
+        for headers in headers_list:
+            send(destination=destination, headers=headers, body=body, **kwargs)
+
 
 class Destination:
     def __init__(self, broker: Broker, destination: str):
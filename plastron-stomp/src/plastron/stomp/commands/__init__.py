@@ -1,8 +1,10 @@
 from importlib import import_module
 from types import ModuleType
-from typing import Optional, Dict, TypeVar, Type
+from typing import TYPE_CHECKING, Optional, Dict, TypeVar, Type
 
-from plastron.repo import Repository
+if TYPE_CHECKING:
+    # annotation-only import; plastron.repo pulls in rdflib
+    from plastron.repo import Repository
 
 
 class BaseCommand:
@@ -10,7 +12,7 @@ class BaseCommand:
         if config is None:
             config = {}
         self.config = config
-        self.repo: Optional[Repository] = None
+        self.repo: Optional['Repository'] = None
         self.result: Optional[Dict] = None
 
 
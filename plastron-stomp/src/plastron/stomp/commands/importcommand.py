@@ -1,21 +1,25 @@
 import io
 import logging
 from argparse import ArgumentTypeError
-from typing import Generator, Any, Dict, Optional
+from typing import TYPE_CHECKING, Generator, Any, Dict, Optional
 
-from rdflib import URIRef
-
-from plastron.context import PlastronContext
-from plastron.jobs import Jobs
-from plastron.jobs.importjob import ImportConfig, ImportJob
-from plastron.rdf import uri_or_curie
 from plastron.stomp.messages import PlastronCommandMessage
 from plastron.utils import datetimestamp, strtobool
 
+if TYPE_CHECKING:
+    # annotation-only imports; plastron.context transitively pulls in
+    # rdflib, the model tree, and plastron.repo
+    from plastron.context import PlastronContext
+    from rdflib import URIRef
+
 logger = logging.getLogger(__name__)
 
 
-def get_access_uri(access) -> Optional[URIRef]:
+def get_access_uri(access) -> Optional['URIRef']:
+    # deferred import, to keep worker startup time short; rdflib is only
+    # needed once an import request actually arrives
+    from plastron.rdf import uri_or_curie
+
     if access is None:
         return None
     try:
@@ -25,7 +29,7 @@ def get_access_uri(access) -> Optional[URIRef]:
 
 
 def importcommand(
-        context: PlastronContext,
+        context: 'PlastronContext',
         message: PlastronCommandMessage,
 ) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
     """
@@ -34,27 +38,35 @@ def importcommand(
     :param context
     :param message:
     """
+    # deferred imports, to keep worker startup time short; the job modules
+    # pull in rdflib, yaml, and the full model tree
+    from plastron.jobs import Jobs
+    from plastron.jobs.importjob import ImportConfig, ImportJob
+
     job_id = message.job_id
+    # the args property scans every header on each access, so decode the
+    # PlastronArg-* headers once and reuse the mapping
+    args = message.args
 
     # per-request options that are NOT saved to the config
-    limit = message.args.get('limit', None)
+    limit = args.get('limit', None)
     if limit is not None:
         limit = int(limit)
     message.body = message.body.encode('utf-8').decode('utf-8-sig')
-    percentage = message.args.get('percent', None)
-    validate_only = bool(strtobool(message.args.get('validate-only', 'false')))
-    publish = bool(strtobool(message.args.get('publish', 'false')))
-    resume = bool(strtobool(message.args.get('resume', 'false')))
+    percentage = args.get('percent', None)
+    validate_only = bool(strtobool(args.get('validate-only', 'false')))
+    publish = bool(strtobool(args.get('publish', 'false')))
+    resume = bool(strtobool(args.get('resume', 'false')))
     import_file = io.StringIO(message.body)
 
     # options that are saved to the config
     job_config_args = {
         'job_id': job_id,
-        'model': message.args.get('model'),
-        'access': get_access_uri(message.args.get('access')),
-        'member_of': message.args.get('member-of'),
-        'container': message.args.get('relpath'),
-        'binaries_location': message.args.get('binaries-location'),
+        'model': args.get('model'),
+        'access': get_access_uri(args.get('access')),
+        'member_of': args.get('member-of'),
+        'container': args.get('relpath'),
+        'binaries_location': args.get('binaries-location'),
     }
 
     if resume and job_id is None:
@@ -1,29 +1,54 @@
 import json
 import logging
-from typing import Generator, Any, Dict
+from typing import TYPE_CHECKING, Generator, Any, Dict
+
+try:
+    # orjson parses JSON in native code and is substantially faster than
+    # the stdlib json module, but is an optional dependency
+    import orjson
+except ImportError:
+    orjson = None
 
-from plastron.context import PlastronContext
-from plastron.jobs.updatejob import UpdateJob
-from plastron.models import get_model_class
-from plastron.rdf import parse_predicate_list
-from plastron.repo import Repository
 from plastron.stomp.messages import PlastronCommandMessage
 from plastron.utils import strtobool
 
+if TYPE_CHECKING:
+    # annotation-only import; plastron.context transitively pulls in
+    # rdflib, the model tree, and plastron.repo
+    from plastron.context import PlastronContext
+
 logger = logging.getLogger(__name__)
 
 
+class ModelRequiredError(RuntimeError):
+    """Raised when an update request asks for validation without naming a
+    model to validate against."""
+    def __init__(self):
+        super().__init__('Model must be provided when performing validation')
+
+
 def parse_message(message: PlastronCommandMessage) -> Dict[str, Any]:
+    # the args property scans every header on each access, so decode the
+    # PlastronArg-* headers once and reuse the mapping
+    args = message.args
+    validate = bool(strtobool(args.get('validate', 'false')))
+    model = args.get('model', None)
+    recursive = args.get('recursive', None)
+
+    # check the arguments before doing any work on the message body, so a
+    # misconfigured request fails immediately
+    if validate and not model:
+        raise ModelRequiredError
+
+    # deferred imports, to keep worker startup time short; these pull in
+    # rdflib and the full model tree
+    from plastron.models import get_model_class
+    from plastron.rdf import parse_predicate_list
+
     message.body = message.body.encode('utf-8').decode('utf-8-sig')
-    body = json.loads(message.body)
+    body = orjson.loads(message.body) if orjson is not None else json.loads(message.body)
     uris = body['uris']
     sparql_update = body['sparql_update']
-    validate = bool(strtobool(message.args.get('validate', 'false')))
-    model = message.args.get('model', None)
-    recursive = message.args.get('recursive', None)
-
-    if validate and not model:
-        raise RuntimeError("Model must be provided when performing validation")
 
     # Retrieve the model to use for validation
     model_class = get_model_class(model) if model else None
@@ -34,14 +59,17 @@ def parse_message(message: PlastronCommandMessage) -> Dict[str, Any]:
         'sparql_update': sparql_update,
         'model_class': model_class,
         'traverse': traverse,
-        'dry_run': bool(strtobool(message.args.get('dry-run', 'false'))),
+        'dry_run': bool(strtobool(args.get('dry-run', 'false'))),
         # Default to no transactions, due to LIBFCREPO-842
-        'use_transactions': not bool(strtobool(message.args.get('no-transactions', 'true'))),
+        'use_transactions': not bool(strtobool(args.get('no-transactions', 'true'))),
     }
 
 
 def update(
-        context: PlastronContext,
+        context: 'PlastronContext',
         message: PlastronCommandMessage,
 ) -> Generator[Dict[str, str], None, Dict[str, Any]]:
+    # deferred import, to keep worker startup time short
+    from plastron.jobs.updatejob import UpdateJob
+
     return UpdateJob(repo=context.repo, **parse_message(message)).run()
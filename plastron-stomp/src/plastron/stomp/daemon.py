@@ -59,7 +59,8 @@ def configure_logging(log_filename_base: str, log_dir: str = 'logs', verbose: bo
 
     # log file configuration
     log_dirname = Path(log_dir)
-    log_dirname.mkdir(parents=True, exist_ok=True)
+    if not log_dirname.is_dir():
+        log_dirname.mkdir(parents=True, exist_ok=True)
     now = datetime.utcnow().strftime('%Y%m%d%H%M%S')
     log_filename = '.'.join((log_filename_base, now, 'log'))
     logfile = log_dirname / log_filename
@@ -1,6 +1,14 @@
 import json
 import logging
 import os
+import sys
+
+try:
+    # optional dependency, used for the compact binary message
+    # serialization in Message.to_bytes()/from_bytes()
+    import msgpack
+except ImportError:
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +63,13 @@ class Message:
 
     def __init__(self, message_id=None, persistent=None, headers=None, body=''):
         if headers is not None:
-            self.headers = headers
+            # decode any bytes keys from the STOMP frame and intern them
+            # all, so the fixed header names used in later lookups compare
+            # by identity instead of byte-by-byte
+            self.headers = {
+                sys.intern(k if isinstance(k, str) else k.decode('ascii')): v
+                for k, v in headers.items()
+            }
         else:
             self.headers = {}
 
@@ -74,6 +88,23 @@ class Message:
     def __str__(self):
         return '\n'.join([f'{k}:{v}' for k, v in self.headers.items()]) + '\n\n' + self.body
 
+    def to_bytes(self) -> bytes:
+        """Serialize this message as a compact binary blob, for peers that
+        support it; smaller on the wire and cheaper to decode than the
+        line-oriented text framing. Requires the optional msgpack library."""
+        if msgpack is None:
+            raise RuntimeError('msgpack is required for binary message serialization')
+        return msgpack.packb({'h': self.headers, 'b': self.body})
+
+    @classmethod
+    def from_bytes(cls, buf: bytes) -> 'Message':
+        """Deserialize a message produced by `to_bytes()`. Requires the
+        optional msgpack library."""
+        if msgpack is None:
+            raise RuntimeError('msgpack is required for binary message serialization')
+        data = msgpack.unpackb(buf, raw=False)
+        return cls(headers=data['h'], body=data['b'])
+
 
 class PlastronMessage(Message):
     job_id = MessageHeader('PlastronJobId')
@@ -131,7 +162,10 @@ class PlastronCommandMessage(PlastronMessage):
 class MessageBox:
     def __init__(self, directory, message_class=None):
         self.dir = directory
-        os.makedirs(directory, exist_ok=True)
+        # a single stat call in the common case where the directory already
+        # exists, instead of makedirs walking the whole path
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
         self.message_class = message_class
 
     def add(self, message_id, message):
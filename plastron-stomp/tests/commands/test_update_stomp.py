@@ -1,57 +1,39 @@
-from unittest.mock import MagicMock
-
 import pytest
 from pytest import raises
 
-from plastron.client import Client, Endpoint
 from plastron.models import Letter, Item
-from plastron.repo import Repository
-from plastron.stomp.commands.update import parse_message
+from plastron.stomp.commands.update import ModelRequiredError, parse_message
 from plastron.stomp.messages import PlastronCommandMessage
 
 
-@pytest.fixture
-def message_body():
-    return '{"uris": ["test"], "sparql_update": "" }'
-
-
-@pytest.fixture
-def repo_base_config():
-    """Required parameters for Repository configuration"""
-    return {
-        'REST_ENDPOINT': 'http://localhost:9999',
-        'RELPATH': '/pcdm',
-        'LOG_DIR': '/logs',
-        'AUTH_TOKEN': 'foobar'
-    }
-
+# headers common to every update command message; test cases only
+# specify the arguments that vary
+BASE_HEADERS = {
+    'PlastronJobId': 'test',
+    'PlastronCommand': 'update',
+}
 
-@pytest.fixture
-def endpoint(repo_base_config):
-    return Endpoint(
-        url=repo_base_config['REST_ENDPOINT'],
-        default_path=repo_base_config['RELPATH'],
-    )
 
-
-@pytest.fixture
-def client(endpoint):
-    return Client(endpoint=endpoint)
+@pytest.fixture(scope='module')
+def message_body():
+    return '{"uris": ["test"], "sparql_update": "" }'
 
 
-@pytest.fixture
-def mock_repo(client):
-    return MagicMock(spec=Repository)
+@pytest.fixture(scope='module')
+def make_message(message_body):
+    """Factory for command messages that share one body string across the
+    module's tests."""
+    def _make_message(headers):
+        return PlastronCommandMessage(headers=headers, body=message_body)
+    return _make_message
 
 
 @pytest.mark.parametrize(
-    ('headers', 'expected_args'),
+    ('header_overrides', 'expected_args'),
     [
         (
             # headers
             {
-                'PlastronJobId': 'test',
-                'PlastronCommand': 'update',
                 'PlastronArg-dry-run': 'True',
                 'PlastronArg-validate': 'False',
                 'PlastronArg-no-transactions': 'False'
@@ -70,8 +52,6 @@ def mock_repo(client):
         (
             # headers
             {
-                'PlastronJobId': 'test',
-                'PlastronCommand': 'update',
                 'PlastronArg-dry-run': 'False',
                 'PlastronArg-validate': 'True',
                 'PlastronArg-model': 'Item',
@@ -91,8 +71,6 @@ def mock_repo(client):
         (
             # headers
             {
-                'PlastronJobId': 'test',
-                'PlastronCommand': 'update',
                 'PlastronArg-dry-run': 'False',
                 'PlastronArg-validate': 'False',
                 'PlastronArg-no-transactions': 'True'
@@ -111,8 +89,6 @@ def mock_repo(client):
         (
             # headers
             {
-                'PlastronJobId': 'test',
-                'PlastronCommand': 'update',
                 'PlastronArg-model': 'Letter',
             },
             # expected_args
@@ -127,21 +103,31 @@ def mock_repo(client):
             },
         ),
     ],
+    ids=['dry-run', 'validate-with-model', 'no-transactions', 'defaults-with-model'],
 )
-def test_parse_message(message_body, headers, expected_args):
-    message = PlastronCommandMessage(headers=headers, body=message_body)
+def test_parse_message(make_message, header_overrides, expected_args):
+    message = make_message({**BASE_HEADERS, **header_overrides})
     assert parse_message(message) == expected_args
 
 
-def test_validate_requires_model(mock_repo, message_body):
-    headers = {
-        'PlastronJobId': 'test',
-        'PlastronCommand': 'update',
+def test_parse_message_binary(make_message):
+    pytest.importorskip('msgpack')
+    message = make_message({**BASE_HEADERS, 'PlastronArg-model': 'Letter'})
+    # a message round-tripped through the binary serialization parses
+    # identically to the original
+    restored = PlastronCommandMessage.from_bytes(message.to_bytes())
+    assert restored.headers == message.headers
+    assert parse_message(restored) == parse_message(message)
+
+
+def test_validate_requires_model(make_message):
+    message = make_message({
+        **BASE_HEADERS,
         'PlastronArg-dry-run': 'False',
         'PlastronArg-validate': 'True',
-        'PlastronArg-no-transactions': 'True'
-    }
-    message = PlastronCommandMessage(headers=headers, body=message_body)
-    with raises(RuntimeError) as exc_info:
+        'PlastronArg-no-transactions': 'True',
+    })
+    # ModelRequiredError fixes the message in its constructor, so the
+    # exception type check is sufficient
+    with raises(ModelRequiredError):
         parse_message(message)
-    assert exc_info.value.args[0] == "Model must be provided when performing validation"
@@ -1,4 +1,5 @@
 from threading import Thread
+from unittest.mock import MagicMock
 
 import pytest
 from coilmq.protocol import STOMP11
@@ -74,3 +75,14 @@ def test_stomp_server_closed(stomp_server, plastrond_stomp):
     plastrond_stomp.stopped.wait(10)
 
     assert not plastrond_stomp.is_alive()
+
+
+def test_send_many_sends_destination_name(broker):
+    # stomp.py only accepts exact str/bytes values when encoding a frame,
+    # so send_many must resolve a Destination object to its name
+    broker.connection = MagicMock()
+    broker.send_many(broker['reindexing'], [{'n': '1'}, {'n': '2'}])
+
+    assert broker.connection.send.call_count == 2
+    for call in broker.connection.send.call_args_list:
+        assert call.kwargs['destination'] == '/queue/reindex'
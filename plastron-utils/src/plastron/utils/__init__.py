@@ -3,11 +3,14 @@ import csv
 import logging
 import os
 import platform
+import queue
 import re
+import sys
+import threading
 from abc import ABC
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Union, Mapping, Sequence
+from typing import Any, Union, Mapping, Sequence
 
 DEFAULT_LOGGING_OPTIONS = {
     'version': 1,
@@ -68,11 +71,26 @@ def datetimestamp(digits_only: bool = True) -> str:
     '2023-11-17T15:20:57'
     ```
     """
-    now = str(datetime.utcnow().isoformat(timespec='seconds'))
+    now = datetime.now(timezone.utc)
     if digits_only:
-        return re.sub(r'[^0-9]', '', now)
+        return now.strftime('%Y%m%d%H%M%S')
     else:
-        return now
+        return now.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+_ENVSUBST_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+
+def _has_placeholder(value: Any) -> bool:
+    """Returns `True` if any string leaf of `value` contains a `${`
+    placeholder marker, short-circuiting on the first one found."""
+    if isinstance(value, str):
+        return '${' in value
+    if isinstance(value, list):
+        return any(_has_placeholder(v) for v in value)
+    if isinstance(value, dict):
+        return any(_has_placeholder(v) for v in value.values())
+    return False
 
 
 def envsubst(value: Union[str, list, dict], env: Mapping[str, str] = None) -> Union[str, list, dict]:
@@ -96,19 +114,28 @@ def envsubst(value: Union[str, list, dict], env: Mapping[str, str] = None) -> Un
     if env is None:
         env = os.environ
     if isinstance(value, str):
-        if '${' in value:
-            try:
-                return value.replace('${', '{').format(**env)
-            except KeyError as e:
-                missing_key = str(e.args[0])
-                logger.warning(f'Environment variable ${{{missing_key}}} not found')
-                # for a missing key, just return the string without substitution
-                return envsubst(value, {missing_key: f'${{{missing_key}}}', **env})
-        else:
+        if '${' not in value:
             return value
+
+        def replace(match: re.Match) -> str:
+            name = match.group(1)
+            try:
+                return env[name]
+            except KeyError:
+                logger.warning(f'Environment variable ${{{name}}} not found')
+                # for a missing key, leave the placeholder as is
+                return match.group(0)
+
+        return _ENVSUBST_PATTERN.sub(replace, value)
     elif isinstance(value, list):
+        if not _has_placeholder(value):
+            # nothing to substitute, so skip rebuilding the list
+            return value
         return [envsubst(v, env) for v in value]
     elif isinstance(value, dict):
+        if not _has_placeholder(value):
+            # nothing to substitute, so skip rebuilding the dictionary
+            return value
         return {k: envsubst(v, env) for k, v in value.items()}
     else:
         return value
@@ -124,6 +151,10 @@ def check_python_version():
         )
 
 
+_TRUE_VALUES = frozenset(('y', 'yes', 't', 'true', 'on', '1'))
+_FALSE_VALUES = frozenset(('n', 'no', 'f', 'false', 'off', '0'))
+
+
 def strtobool(val: str) -> int:
     """Convert a string representation of truth to true (1) or false (0).
 
@@ -140,9 +171,9 @@ def strtobool(val: str) -> int:
     returns an integer. This is copied directly from the distutils module.
     """
     val = val.lower()
-    if val in ('y', 'yes', 't', 'true', 'on', '1'):
+    if val in _TRUE_VALUES:
         return 1
-    elif val in ('n', 'no', 'f', 'false', 'off', '0'):
+    elif val in _FALSE_VALUES:
         return 0
     else:
         raise ValueError("invalid truth value %r" % (val,))
@@ -179,14 +210,30 @@ class ItemLog(AppendableSequence):
     `ItemLog` objects are iterable, and support direct indexing to a row
     by key.
     """
-    def __init__(self, filename: Union[str, Path], fieldnames: Sequence[str], keyfield: str, header: bool = True):
+    DEFAULT_CHUNK_SIZE = 1 << 20
+    """Default read buffer size, in bytes."""
+
+    def __init__(
+            self,
+            filename: Union[str, Path],
+            fieldnames: Sequence[str],
+            keyfield: str,
+            header: bool = True,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            flush_interval: int = 1,
+    ):
         self.filename: Path = Path(filename)
         self.fieldnames: Sequence[str] = fieldnames
         self.keyfield: str = keyfield
         self.write_header: bool = header
+        self.chunk_size: int = chunk_size
+        self.flush_interval: int = flush_interval
+        self._fieldnames_tuple = tuple(fieldnames)
         self._item_keys = set()
         self._fh = None
         self._writer = None
+        self._pending = 0
+        self._header_validated = False
         if self.exists():
             self._load_keys()
 
@@ -197,25 +244,48 @@ class ItemLog(AppendableSequence):
     def create(self):
         """Create the CSV log file. This will overwrite an existing file. If
         `write_header` is `True`, it will also write a header row to the file."""
-        with self.filename.open(mode='w', buffering=1) as fh:
-            writer = csv.DictWriter(fh, fieldnames=self.fieldnames)
+        with self.filename.open(mode='w', buffering=1, newline='') as fh:
             if self.write_header:
-                writer.writeheader()
+                csv.writer(fh).writerow(self.fieldnames)
+
+    def _iter_key_column(self):
+        """Iterate over just the values of the key column. Unlike `__iter__`,
+        this uses a plain `csv.reader` with a precomputed column index, so no
+        per-row dictionaries are built. Intended for bulk key loading."""
+        try:
+            with self.filename.open(mode='r', buffering=self.chunk_size, newline='') as fh:
+                reader = csv.reader(fh)
+                try:
+                    header = next(reader)
+                except StopIteration:
+                    # empty file, so there are no keys
+                    return
+                key_index = header.index(self.keyfield)
+                for row in reader:
+                    yield row[key_index]
+        except FileNotFoundError:
+            # log file not found, so stop the iteration
+            return
 
     def _load_keys(self):
-        for row in iter(self):
-            self._item_keys.add(row[self.keyfield])
+        for key in self._iter_key_column():
+            # intern the keys so that the same identifier loaded into several
+            # logs (or re-read across runs) shares one backing string
+            self._item_keys.add(sys.intern(key))
 
     def __iter__(self):
         try:
-            with self.filename.open(mode='r', buffering=1) as fh:
+            with self.filename.open(mode='r', buffering=self.chunk_size, newline='') as fh:
                 reader = csv.DictReader(fh)
-                # check the validity of the map file data
-                if not reader.fieldnames == self.fieldnames:
-                    logger.warning(
-                        f'Fieldnames in {self.filename} do not match expected fieldnames; '
-                        f'expected: {self.fieldnames}; found: {reader.fieldnames}'
-                    )
+                # check the validity of the map file data; the file's columns
+                # do not change between iterations, so only check once
+                if not self._header_validated:
+                    if not reader.fieldnames == self.fieldnames:
+                        logger.warning(
+                            f'Fieldnames in {self.filename} do not match expected fieldnames; '
+                            f'expected: {self.fieldnames}; found: {reader.fieldnames}'
+                        )
+                    self._header_validated = True
                 # read the data from the existing file
                 yield from reader
         except FileNotFoundError:
@@ -223,20 +293,61 @@ class ItemLog(AppendableSequence):
             return
 
     @property
-    def writer(self) -> csv.DictWriter:
-        """CSV dictionary writer"""
+    def writer(self):
+        """CSV writer for the append file handle"""
         if not self.exists():
             self.create()
         if self._fh is None:
-            self._fh = self.filename.open(mode='a', buffering=1)
+            self._fh = self.filename.open(mode='a', buffering=self.chunk_size, newline='')
         if self._writer is None:
-            self._writer = csv.DictWriter(self._fh, fieldnames=self.fieldnames)
+            self._writer = csv.writer(self._fh)
         return self._writer
 
+    def _write_row(self, row):
+        # write the field values positionally instead of going through
+        # DictWriter's per-row fieldname bookkeeping; missing fields are
+        # written as empty strings, as DictWriter's restval would do
+        self.writer.writerow([row.get(name, '') for name in self._fieldnames_tuple])
+        self._pending += 1
+        if self._pending >= self.flush_interval:
+            self.flush()
+
+    def _add_key(self, row):
+        key = row[self.keyfield]
+        if type(key) is str:
+            # only exact str instances can be interned; some callers use
+            # str subclasses (e.g. URL classes) as keys
+            key = sys.intern(key)
+        self._item_keys.add(key)
+
     def append(self, row):
-        """Write this `row` to the log."""
-        self.writer.writerow(row)
-        self._item_keys.add(row[self.keyfield])
+        """Write this `row` to the log. Rows are flushed to disk every
+        `flush_interval` rows; the default interval of 1 flushes after
+        every row, for crash safety. Bulk writers may use a larger
+        interval, and should call `flush()` or `close()` when done."""
+        self._write_row(row)
+        self._add_key(row)
+
+    def flush(self):
+        """Flush any buffered rows to disk."""
+        if self._fh is not None:
+            self._fh.flush()
+        self._pending = 0
+
+    def close(self):
+        """Flush and close the underlying file handle, if it is open."""
+        if self._fh is not None:
+            self._fh.flush()
+            self._fh.close()
+            self._fh = None
+            self._writer = None
+        self._pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def writerow(self, row):
         """Alias for `append`"""
@@ -255,5 +366,109 @@ class ItemLog(AppendableSequence):
         raise IndexError(item)
 
 
+class AsyncItemLog(AppendableSequence):
+    """Wrapper around an `ItemLog` that hands the CSV writes off to a single
+    background thread, so that appending does not block the caller on disk
+    latency. Keys are recorded synchronously, so containment checks and
+    lengths include rows that are queued but not yet written; call `join()`
+    to block until every queued row has reached the log file, and `close()`
+    when done with the log to stop the writer thread."""
+
+    _stop = object()
+    """Sentinel queued by `close()` to stop the writer thread."""
+
+    def __init__(self, log: ItemLog):
+        self.log = log
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = None
+        self._error = None
+
+    def _drain_queue(self):
+        while True:
+            row = self._queue.get()
+            if row is self._stop:
+                self._queue.task_done()
+                return
+            try:
+                self.log._write_row(row)
+            except Exception as e:
+                logger.error(f'Unable to write row to {self.log.filename}: {e}')
+                # the key was recorded when the row was queued; remove it so
+                # containment checks do not claim a row that never reached
+                # the file, and save the failure to re-raise in the caller
+                self.log._item_keys.discard(row[self.log.keyfield])
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise ItemLogError(f'Unable to write row to {self.log.filename}') from error
+
+    def append(self, row):
+        """Record this row's key, and queue the row to be written to the
+        underlying log.
+
+        :raises ItemLogError: if a previously queued row could not be written
+        """
+        self._raise_pending_error()
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._drain_queue,
+                name=f'AsyncItemLog-{self.log.filename.name}',
+                daemon=True,
+            )
+            self._thread.start()
+        self.log._add_key(row)
+        self._queue.put(row)
+
+    def join(self):
+        """Block until all rows queued so far have been written to the log.
+
+        :raises ItemLogError: if any queued row could not be written
+        """
+        self._queue.join()
+        self._raise_pending_error()
+
+    def close(self):
+        """Write any queued rows, stop the writer thread, and close the
+        underlying log file. The log can still be used afterwards; the next
+        `append()` starts a new writer thread.
+
+        :raises ItemLogError: if any queued row could not be written
+        """
+        if self._thread is not None:
+            self._queue.put(self._stop)
+            self._thread.join()
+            self._thread = None
+        self.log.close()
+        self._raise_pending_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def _item_keys(self):
+        return self.log._item_keys
+
+    def __contains__(self, other):
+        return other in self.log
+
+    def __len__(self):
+        return len(self.log)
+
+    def __getitem__(self, item):
+        self.join()
+        return self.log[item]
+
+    def __iter__(self):
+        self.join()
+        return iter(self.log)
+
+
 class ItemLogError(Exception):
     pass
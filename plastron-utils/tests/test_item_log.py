@@ -0,0 +1,37 @@
+import pytest
+
+from plastron.utils import AsyncItemLog, ItemLog, ItemLogError
+
+
+def test_async_item_log_writes_rows(tmp_path):
+    log = AsyncItemLog(ItemLog(tmp_path / 'items.csv', ['id', 'title'], 'id'))
+    log.append({'id': 'foo', 'title': 'Foo'})
+    log.join()
+    assert 'foo' in log
+    assert [row['id'] for row in log.log] == ['foo']
+
+
+def test_async_item_log_raises_write_failure(tmp_path):
+    # a directory in place of the log file makes every write fail
+    filename = tmp_path / 'items.csv'
+    filename.mkdir()
+    log = AsyncItemLog(ItemLog(filename, ['id', 'title'], 'id'))
+    log.append({'id': 'foo', 'title': 'Foo'})
+    with pytest.raises(ItemLogError):
+        log.join()
+    # the failed row must not be reported as present in the log
+    assert 'foo' not in log
+
+
+def test_async_item_log_close_stops_writer_thread(tmp_path):
+    log = AsyncItemLog(ItemLog(tmp_path / 'items.csv', ['id', 'title'], 'id'))
+    log.append({'id': 'foo', 'title': 'Foo'})
+    log.close()
+    # the writer thread has exited and the row is on disk
+    assert log._thread is None
+    assert [row['id'] for row in log.log] == ['foo']
+    # the log can be reused after close; a new writer thread is started
+    log.append({'id': 'bar', 'title': 'Bar'})
+    log.close()
+    assert log._thread is None
+    assert [row['id'] for row in log.log] == ['foo', 'bar']